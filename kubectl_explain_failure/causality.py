@@ -56,7 +56,6 @@ class CausalChain:
         # If there is a blocking cause, it must have a valid root role
         if blocking_causes:
             cause = blocking_causes[0]
-            print(f"DEBUG: blocking cause code={cause.code}, role={cause.role!r}")
 
             if cause.role not in BLOCKING_ROOT_ROLES:
                 raise ValueError(
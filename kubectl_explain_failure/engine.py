@@ -1,4 +1,5 @@
 import os
+from collections.abc import Collection, Iterable
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any
@@ -14,7 +15,9 @@ from kubectl_explain_failure.model import get_pod_name, get_pod_phase
 from kubectl_explain_failure.relations import build_relations
 from kubectl_explain_failure.rules.base_rule import FailureRule
 from kubectl_explain_failure.timeline import (
+    Timeline,
     build_timeline,
+    event_reasons,
     timeline_has_event,
 )
 
@@ -34,14 +37,91 @@ def get_default_rules() -> list[FailureRule]:
     return _DEFAULT_RULES
 
 
+class RuleIndex:
+    """
+    Buckets rules by their optional `trigger_reasons` hint so rules whose
+    trigger event is absent are never evaluated.
+
+    - by_event_reason: event reason -> positions of rules it triggers
+    - hard: positions of rules without a hint; always candidates
+    - phase_sets: per-position frozenset of supported pod phases, or None
+      when the rule is not phase-gated
+
+    Positions refer to `rules`, a snapshot of the list the index was built
+    from, so later edits to that list cannot shift them.
+    """
+
+    def __init__(self, rules: list[FailureRule]):
+        self.rules = tuple(rules)
+        self.by_event_reason: dict[str, list[int]] = {}
+        self.hard: list[int] = []
+        self.phase_sets: list[frozenset[str] | None] = []
+
+        for pos, rule in enumerate(rules):
+            phases = getattr(rule, "phases", None) or getattr(
+                rule, "supported_phases", None
+            )
+            if isinstance(phases, str):
+                phases = [phases]
+            self.phase_sets.append(frozenset(phases) if phases else None)
+
+            triggers = getattr(rule, "trigger_reasons", None)
+            if not triggers:
+                self.hard.append(pos)
+                continue
+            for reason in triggers:
+                self.by_event_reason.setdefault(reason, []).append(pos)
+
+    def candidates(
+        self,
+        event_reasons: Iterable[Any],
+        pod_phase: str,
+    ) -> list[FailureRule]:
+        """
+        Rules that may match events with the given reasons for a pod in
+        `pod_phase`, in their original order.
+        """
+        positions: Iterable[int]
+        if self.by_event_reason:
+            hits = set(self.hard)
+            for reason in event_reasons:
+                hits.update(self.by_event_reason.get(reason, ()))
+            positions = sorted(hits)
+        else:
+            positions = range(len(self.rules))
+
+        phase_sets = self.phase_sets
+        return [
+            self.rules[pos]
+            for pos in positions
+            if (phases := phase_sets[pos]) is None or pod_phase in phases
+        ]
+
+
+_LAST_RULE_INDEX: RuleIndex | None = None
+
+
+def get_rule_index(rules: list[FailureRule]) -> RuleIndex:
+    """
+    Returns a RuleIndex for `rules`, reusing the previous one when called
+    again with the same rules in the same order (the default rule set in
+    practice). Rules compare by identity, so the check is a pointer scan.
+    """
+    global _LAST_RULE_INDEX
+    index = _LAST_RULE_INDEX
+    if index is None or index.rules != tuple(rules):
+        index = _LAST_RULE_INDEX = RuleIndex(rules)
+    return index
+
+
 def _norm_category(rule: FailureRule) -> str:
     return (getattr(rule, "category", "") or "").strip().lower()
 
 
 def _passes_category_filters(
     rule: FailureRule,
-    enabled_categories: list[str] | None,
-    disabled_categories: list[str] | None,
+    enabled_categories: Collection[str] | None,
+    disabled_categories: Collection[str] | None,
 ) -> bool:
     category = getattr(rule, "category", None)
     if enabled_categories and category not in enabled_categories:
@@ -406,8 +486,8 @@ def _apply_post_resolution_rules(
     events: list[dict[str, Any]],
     context: dict[str, Any],
     rules: list[FailureRule],
-    enabled_categories: list[str] | None,
-    disabled_categories: list[str] | None,
+    enabled_categories: Collection[str] | None,
+    disabled_categories: Collection[str] | None,
     verbose: bool,
 ) -> dict[str, Any]:
     if not result.get("resolution"):
@@ -450,8 +530,8 @@ def _finalize_result(
     events: list[dict[str, Any]],
     context: dict[str, Any],
     rules: list[FailureRule],
-    enabled_categories: list[str] | None,
-    disabled_categories: list[str] | None,
+    enabled_categories: Collection[str] | None,
+    disabled_categories: Collection[str] | None,
     verbose: bool,
 ) -> dict[str, Any]:
     return _apply_post_resolution_rules(
@@ -476,9 +556,10 @@ def explain_failure(
     events: list[dict[str, Any]],
     context: dict[str, Any] | None = None,
     rules: list[FailureRule] | None = None,
-    enabled_categories: list[str] | None = None,
-    disabled_categories: list[str] | None = None,
+    enabled_categories: Collection[str] | None = None,
+    disabled_categories: Collection[str] | None = None,
     verbose: bool = False,
+    short_circuit_threshold: float | None = None,
 ) -> dict[str, Any]:
     """
     Explains why a Pod is failing by evaluating all applicable rules.
@@ -488,6 +569,10 @@ def explain_failure(
     - Merges evidence, likely causes, and suggested checks
     - Normalizes confidence using noisy-OR
     - Enforces strong causal precedence for PVC-related failures
+
+    If short_circuit_threshold is set, rules are evaluated in priority
+    order and evaluation stops at the first match whose confidence reaches
+    it; lower-priority rules then contribute no evidence.
     """
     # -------------------------------------------------
     # MERGE pod-level object graph into context
@@ -574,6 +659,10 @@ def explain_failure(
     context.setdefault("_engine_state", {})
     context["_engine_state"]["matched_rules"] = []
 
+    # Event reason set shared by every rule (see timeline.event_reasons)
+    context["_engine_state"]["events"] = events
+    context["_engine_state"]["event_reasons"] = event_reasons(events)
+
     explanations: list[tuple[dict[str, Any], FailureRule, CausalChain]] = []
 
     # ----------------------------
@@ -589,18 +678,18 @@ def explain_failure(
     # ----------------------------
     # Rule filtering
     # ----------------------------
+    present_reasons: Iterable[str] = context["_engine_state"]["event_reasons"]
+    timeline = context.get("timeline")
+    if isinstance(timeline, Timeline) and timeline.events is not events:
+        # Caller-supplied timeline; its events may be what rules inspect
+        present_reasons = present_reasons | timeline.reason_counts.keys()
+
     filtered_rules = []
-    for rule in rules:
+    # Phase gating happens inside the index against precomputed phase sets
+    for rule in get_rule_index(rules).candidates(present_reasons, pod_phase):
         if getattr(rule, "post_resolution", False):
             continue
 
-        # Phase gating
-        phases = getattr(rule, "phases", None) or getattr(
-            rule, "supported_phases", None
-        )
-        if phases and pod_phase not in phases:
-            continue
-
         # Container-state gating
         required_states = getattr(rule, "container_states", None)
         if required_states:
@@ -619,6 +708,10 @@ def explain_failure(
 
         filtered_rules.append(rule)
 
+    if short_circuit_threshold is not None:
+        # Stable: equal priorities keep their given order
+        filtered_rules.sort(key=lambda r: getattr(r, "priority", 100), reverse=True)
+
     # ----------------------------
     # Rule evaluation
     # ----------------------------
@@ -771,6 +864,17 @@ def explain_failure(
                     f"confidence={exp.get('confidence', 0.0):.2f})"
                 )
 
+            if (
+                short_circuit_threshold is not None
+                and exp["confidence"] >= short_circuit_threshold
+            ):
+                if verbose:
+                    print(
+                        f"[DEBUG] Short-circuiting after '{rule.name}' "
+                        f"(confidence >= {short_circuit_threshold:.2f})"
+                    )
+                break
+
     # ----------------------------
     # No matches → Unknown
     # ----------------------------
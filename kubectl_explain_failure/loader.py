@@ -1,7 +1,9 @@
 import glob
 import importlib.util
 import os
+import types
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import yaml
@@ -10,6 +12,12 @@ from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
 from kubectl_explain_failure.timeline import timeline_has_pattern
 
+try:
+    # libyaml-backed loader; same safe semantics, much faster parsing
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # ----------------------------
 # Dynamic Rule Loader
 # ----------------------------
@@ -22,7 +30,12 @@ class YamlFailureRule(FailureRule):
         self.severity = spec.get("severity", "Medium")
         self.priority = spec.get("priority", 100)
         self.requires = spec.get("requires", {})  # 🔧 REQUIRED
+        self.trigger_reasons = spec.get("trigger_reasons", [])
         self.spec = spec
+        # Compiled once so matches() does not re-parse the expression per pod
+        self._condition = compile(
+            spec.get("if", "False"), f"<rule:{self.name}>", "eval"
+        )
 
     @staticmethod
     def _normalize_k8s_object(obj: Any) -> None:
@@ -59,7 +72,7 @@ class YamlFailureRule(FailureRule):
             "timeline_has_pattern": timeline_has_pattern,
         }
 
-        return eval(self.spec.get("if", "False"), eval_globals, safe_context)
+        return eval(self._condition, eval_globals, safe_context)
 
     def explain(self, pod, events, context):
         then = self.spec.get("then", {})
@@ -124,6 +137,12 @@ def validate_rule(rule: FailureRule):
     if not isinstance(rule.requires, dict):
         raise ValueError(f"Rule {rule.name}.requires must be a dict")
 
+    trigger_reasons = getattr(rule, "trigger_reasons", [])
+    if not isinstance(trigger_reasons, (list, tuple, set, frozenset)) or not all(
+        isinstance(r, str) for r in trigger_reasons
+    ):
+        raise ValueError(f"Rule {rule.name}.trigger_reasons must be a list of strings")
+
     allowed_keys = {"pod", "events", "context", "objects", "optional_objects"}
     unknown = set(rule.requires) - allowed_keys
     if unknown:
@@ -139,6 +158,38 @@ def validate_rule(rule: FailureRule):
         raise ValueError(f"Rule {rule.name}.requires.optional_objects must be a list")
 
 
+# ----------------------------
+# Rule module cache
+# ----------------------------
+
+# file path -> (mtime, module). Unchanged rule files are executed only once per
+# process; editing a file bumps its mtime and forces a reload.
+_RULE_MODULE_CACHE: dict[str, tuple[float, types.ModuleType]] = {}
+
+
+def _load_rule_module(file: str) -> types.ModuleType | None:
+    file = os.path.abspath(file)
+    mtime = os.path.getmtime(file)
+    cached = _RULE_MODULE_CACHE.get(file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    module_name = os.path.splitext(os.path.basename(file))[0]
+    spec = importlib.util.spec_from_file_location(module_name, file)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    _RULE_MODULE_CACHE[file] = (mtime, module)
+    return module
+
+
+def _read_yaml_rule_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
+
+
 def load_rules(rule_folder=None) -> list[FailureRule]:
     if rule_folder is None:
         rule_folder = os.path.join(os.path.dirname(__file__), "rules")
@@ -149,12 +200,9 @@ def load_rules(rule_folder=None) -> list[FailureRule]:
     for file in glob.glob(os.path.join(rule_folder, "**", "*.py"), recursive=True):
         if os.path.basename(file) == "base_rule.py":
             continue
-        module_name = os.path.splitext(os.path.basename(file))[0]
-        spec = importlib.util.spec_from_file_location(module_name, file)
-        if spec is None or spec.loader is None:
+        module = _load_rule_module(file)
+        if module is None:
             continue
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
         for attr in dir(module):
             cls = getattr(module, attr)
             if (
@@ -165,11 +213,17 @@ def load_rules(rule_folder=None) -> list[FailureRule]:
                 rules.append(cls())
 
     # ---- YAML rules ----
-    for yfile in glob.glob(os.path.join(rule_folder, "*.yaml")):
-        with open(yfile, encoding="utf-8") as f:
-            spec = yaml.safe_load(f)
-            if spec:  # skip empty YAML files
-                rules.extend(build_yaml_rules(spec))  # support multiple rules per file
+    yaml_files = glob.glob(os.path.join(rule_folder, "*.yaml"))
+    if len(yaml_files) > 1:
+        # Read and parse files concurrently; rules are built in file order below
+        with ThreadPoolExecutor() as pool:
+            yaml_specs = list(pool.map(_read_yaml_rule_file, yaml_files))
+    else:
+        yaml_specs = [_read_yaml_rule_file(yfile) for yfile in yaml_files]
+
+    for spec in yaml_specs:
+        if spec:  # skip empty YAML files
+            rules.extend(build_yaml_rules(spec))  # support multiple rules per file
 
     # ---- CONTRACT VALIDATION ----
     for rule in rules:
@@ -20,6 +20,10 @@ def get_pod_name(pod: dict[str, Any]) -> str:
 
 
 def normalize_events(events: Any) -> list[dict[str, Any]]:
+    """
+    Returns the event list without copying; callers must treat it as
+    read-only.
+    """
     if isinstance(events, list):
         # Already a list of event dicts
         return events
@@ -33,6 +33,7 @@ class TokenProjectionFailureRule(FailureRule):
         "objects": [],
     }
     deterministic = True
+    trigger_reasons = ["TokenProjectionFailure"]
     blocks = ["ServiceAccountMissing", "ServiceAccountRBAC"]
 
     def matches(self, pod, events, context) -> bool:
@@ -34,6 +34,7 @@ class CrashLoopBackOffRule(FailureRule):
         "context": ["timeline"],
     }
     deterministic = True
+    trigger_reasons = ["BackOff"]
     phases = ["Running", "Pending"]
 
     def matches(self, pod, events, context) -> bool:
@@ -31,12 +31,15 @@ class ImagePullRule(FailureRule):
     category = "Image"
     priority = 30
     deterministic = True
+    trigger_reasons = ["ErrImagePull"]
     container_states = ["waiting"]
     requires = {
         "context": ["timeline"],
     }
     blocks = []
 
+    IMAGE_NAME_RE = re.compile(r"image '([^']+)'")
+
     def matches(self, pod, events, context):
         timeline = context.get("timeline")
         if not timeline:
@@ -73,7 +76,7 @@ class ImagePullRule(FailureRule):
             if waiting and waiting.get("reason") == "ErrImagePull":
                 # Extract image name from message
                 msg = waiting.get("message", "")
-                match = re.search(r"image '([^']+)'", msg)
+                match = self.IMAGE_NAME_RE.search(msg)
                 image_name = match.group(1) if match else msg
                 container_evidence.append(
                     f"Container '{cs['name']}' failed to pull image '{image_name}'"
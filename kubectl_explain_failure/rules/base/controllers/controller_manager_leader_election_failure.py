@@ -5,7 +5,12 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class ControllerManagerLeaderElectionFailureRule(FailureRule):
@@ -112,10 +117,10 @@ class ControllerManagerLeaderElectionFailureRule(FailureRule):
         ]
 
     def _message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _pod_text(self, pod_obj: dict[str, Any]) -> str:
         metadata = pod_obj.get("metadata", {})
@@ -4,7 +4,11 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+)
 
 
 class ReplicaSetOwnershipConflictRule(FailureRule):
@@ -59,10 +63,10 @@ class ReplicaSetOwnershipConflictRule(FailureRule):
         return str(source or "").lower()
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _match_selector(
         self,
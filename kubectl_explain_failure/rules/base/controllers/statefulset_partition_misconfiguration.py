@@ -5,7 +5,12 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class StatefulSetPartitionMisconfigurationRule(FailureRule):
@@ -116,10 +121,10 @@ class StatefulSetPartitionMisconfigurationRule(FailureRule):
         return str(source or "").lower()
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _span_seconds(self, events: list[dict[str, Any]]) -> float:
         timestamps = [self._event_ts(event) for event in events]
@@ -7,7 +7,7 @@ from kubectl_explain_failure.rules.base_rule import FailureRule
 from kubectl_explain_failure.rules.multi_container_helpers import (
     is_recognized_sidecar_container,
 )
-from kubectl_explain_failure.timeline import Timeline
+from kubectl_explain_failure.timeline import Timeline, event_message_lower
 
 
 class SidecarCrashLoopRule(FailureRule):
@@ -36,7 +36,7 @@ class SidecarCrashLoopRule(FailureRule):
     CACHE_KEY = "_sidecar_crashloop_candidate"
 
     def _message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _is_sidecar(self, pod: dict[str, Any], container_name: str) -> bool:
         return is_recognized_sidecar_container(pod, container_name)
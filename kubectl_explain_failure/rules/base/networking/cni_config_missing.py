@@ -5,7 +5,12 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class CNIConfigMissingRule(FailureRule):
@@ -111,10 +116,10 @@ class CNIConfigMissingRule(FailureRule):
         return [event for _, event in sorted(enumerated, key=sort_key)]
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_targets_pod(self, event: dict[str, Any], pod: dict[str, Any]) -> bool:
         involved = event.get("involvedObject", {})
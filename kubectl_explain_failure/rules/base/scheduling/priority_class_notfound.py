@@ -42,6 +42,7 @@ class PriorityClassNotFoundRule(FailureRule):
 
     CACHE_KEY = "_priority_class_notfound_candidate"
     WINDOW_MINUTES = 60
+    QUOTED_NAME_RE = re.compile(r'["\']([^"\']+)["\']')
 
     MISSING_CLASS_MARKERS = (
         "no priorityclass with name",
@@ -157,7 +158,7 @@ class PriorityClassNotFoundRule(FailureRule):
         if class_name in msg:
             return True
 
-        quoted_names = re.findall(r'["\']([^"\']+)["\']', message)
+        quoted_names = self.QUOTED_NAME_RE.findall(message)
         return any(name.lower() == class_name for name in quoted_names)
 
     def _looks_missing_priority_class(
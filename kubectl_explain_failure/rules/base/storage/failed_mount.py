@@ -36,6 +36,7 @@ class FailedMountRule(FailureRule):
         "context": ["timeline"],
     }
     deterministic = True
+    trigger_reasons = ["FailedMount"]
     blocks = ["PVCNotBound", "VolumeUnavailable"]
 
     def matches(self, pod, events, context) -> bool:
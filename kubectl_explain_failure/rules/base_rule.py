@@ -15,6 +15,7 @@ class FailureRule:
     # ---- Optional execution hints ----
     phases: list[str] = []  # e.g. ["Pending", "Running"]
     container_states: list[str] = []  # e.g. ["waiting", "terminated"]
+    trigger_reasons: list[str] = []  # only evaluated if an event has one
     dependencies: list[str] = []  # names of other rules
     post_resolution: bool = False
     augment_only: bool = False
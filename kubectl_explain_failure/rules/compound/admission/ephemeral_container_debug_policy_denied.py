@@ -5,6 +5,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
+from kubectl_explain_failure.timeline import event_message_lower, event_reason_lower
 
 
 class EphemeralContainerDebugPolicyDeniedRule(FailureRule):
@@ -127,10 +128,10 @@ class EphemeralContainerDebugPolicyDeniedRule(FailureRule):
     )
 
     def _reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _text(self, event: dict[str, Any]) -> str:
         return f"{self._reason(event)} {self._message(event)}"
@@ -6,7 +6,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_reason_lower, parse_time
 
 
 class DeploymentRollbackLoopRule(FailureRule):
@@ -63,7 +63,7 @@ class DeploymentRollbackLoopRule(FailureRule):
         return str(source or "").lower()
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_timestamp(self, event: dict[str, Any]) -> datetime | None:
         raw = (
@@ -6,7 +6,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_reason_lower, parse_time
 
 
 class DNSFailureThenCrashLoopRule(FailureRule):
@@ -112,7 +112,7 @@ class DNSFailureThenCrashLoopRule(FailureRule):
         return self._event_message(event).lower()
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _occurrences(self, event: dict[str, Any]) -> int:
         raw_count = event.get("count", 1)
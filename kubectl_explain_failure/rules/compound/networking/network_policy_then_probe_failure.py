@@ -7,7 +7,12 @@ from typing import Any, TypedDict
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class TargetInfo(TypedDict):
@@ -105,6 +110,17 @@ class NetworkPolicyThenProbeFailureRule(FailureRule):
         "lookup ",
     )
     TARGET_RE = re.compile(r"(?P<host>[a-z0-9.-]+)(?::(?P<port>\d+))?", re.IGNORECASE)
+    TARGET_MESSAGE_PATTERNS = (
+        re.compile(
+            r"(?:failed to connect to|because dependency)\s+(?P<target>[a-z0-9.-]+(?::\d+)?)"
+        ),
+        re.compile(r"dial tcp\s+(?P<target>[a-z0-9.-]+:\d+)"),
+        re.compile(r"upstream\s+(?P<target>[a-z0-9.-]+(?::\d+)?)"),
+    )
+    SERVICE_HOST_RE = re.compile(
+        r"([a-z0-9-]+(?:\.[a-z0-9-]+){0,3}\.svc(?:\.cluster\.local)?(?::\d+)?)"
+    )
+    IPV4_RE = re.compile(r"^\d{1,3}(\.\d{1,3}){3}$")
 
     def _parse_timestamp(self, raw: Any) -> datetime | None:
         if not isinstance(raw, str):
@@ -146,10 +162,10 @@ class NetworkPolicyThenProbeFailureRule(FailureRule):
         ]
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_component(self, event: dict[str, Any]) -> str:
         source = event.get("source")
@@ -286,22 +302,14 @@ class NetworkPolicyThenProbeFailureRule(FailureRule):
         ]
 
     def _extract_target(self, message: str, pod_namespace: str) -> TargetInfo | None:
-        patterns = (
-            r"(?:failed to connect to|because dependency)\s+(?P<target>[a-z0-9.-]+(?::\d+)?)",
-            r"dial tcp\s+(?P<target>[a-z0-9.-]+:\d+)",
-            r"upstream\s+(?P<target>[a-z0-9.-]+(?::\d+)?)",
-        )
         target = None
-        for pattern in patterns:
-            match = re.search(pattern, message)
+        for pattern in self.TARGET_MESSAGE_PATTERNS:
+            match = pattern.search(message)
             if match:
                 target = match.group("target")
                 break
         if target is None:
-            svc_match = re.search(
-                r"([a-z0-9-]+(?:\.[a-z0-9-]+){0,3}\.svc(?:\.cluster\.local)?(?::\d+)?)",
-                message,
-            )
+            svc_match = self.SERVICE_HOST_RE.search(message)
             if svc_match:
                 target = svc_match.group(1)
         if target is None:
@@ -319,7 +327,7 @@ class NetworkPolicyThenProbeFailureRule(FailureRule):
             service_name = parts[0]
             if len(parts) > 1 and parts[1] != "svc":
                 service_namespace = parts[1]
-        elif "." not in host and not re.match(r"^\d{1,3}(\.\d{1,3}){3}$", host):
+        elif "." not in host and not self.IPV4_RE.match(host):
             service_name = host
         return {
             "raw": target,
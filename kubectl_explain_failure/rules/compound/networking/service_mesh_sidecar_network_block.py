@@ -9,7 +9,12 @@ from kubectl_explain_failure.rules.multi_container_helpers import (
     is_recognized_sidecar_container,
     pod_has_sidecar_injection_signal,
 )
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class ServiceMeshSidecarNetworkBlockRule(FailureRule):
@@ -131,10 +136,10 @@ class ServiceMeshSidecarNetworkBlockRule(FailureRule):
         ]
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_component(self, event: dict[str, Any]) -> str:
         source = event.get("source")
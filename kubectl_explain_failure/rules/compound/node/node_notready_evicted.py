@@ -1,5 +1,6 @@
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
+from kubectl_explain_failure.timeline import event_reasons
 
 
 class NodeNotReadyEvictedRule(FailureRule):
@@ -50,7 +51,7 @@ class NodeNotReadyEvictedRule(FailureRule):
             for node in node_objs.values()
         )
 
-        evicted = any(e.get("reason") == "Evicted" for e in events)
+        evicted = "Evicted" in event_reasons(events, context)
 
         return node_not_ready and evicted
 
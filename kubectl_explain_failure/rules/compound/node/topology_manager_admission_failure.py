@@ -4,6 +4,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
+from kubectl_explain_failure.timeline import event_message_lower, event_reason_lower
 
 
 class TopologyManagerAdmissionFailureRule(FailureRule):
@@ -87,10 +88,10 @@ class TopologyManagerAdmissionFailureRule(FailureRule):
     )
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_text(self, event: dict[str, Any]) -> str:
         return f"{self._event_reason(event)} " f"{self._event_message(event)}"
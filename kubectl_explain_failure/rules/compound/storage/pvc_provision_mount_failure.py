@@ -1,5 +1,6 @@
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
+from kubectl_explain_failure.timeline import event_reasons
 
 
 class PVCProvisionThenMountFailureRule(FailureRule):
@@ -121,8 +122,8 @@ class PVCProvisionThenMountFailureRule(FailureRule):
         ):
             return False
 
-        if not pod.get("spec", {}).get("nodeName") and not any(
-            event.get("reason") == "Scheduled" for event in timeline.raw_events
+        if not pod.get("spec", {}).get("nodeName") and "Scheduled" not in event_reasons(
+            timeline.raw_events, context
         ):
             return False
 
@@ -5,7 +5,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_message_lower, parse_time
 
 
 class CrashLoopFrequencySpikeRule(FailureRule):
@@ -105,7 +105,7 @@ class CrashLoopFrequencySpikeRule(FailureRule):
         ]
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _relevant_events(
         self,
@@ -6,7 +6,7 @@ from typing import Any, TypedDict
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_reason_lower, parse_time
 
 
 class Candidate(TypedDict):
@@ -146,7 +146,7 @@ class DependencyRecoveryDelayRule(FailureRule):
         return str(event.get("message", ""))
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _occurrences(self, event: dict[str, Any]) -> int:
         try:
@@ -5,7 +5,7 @@ from typing import Any
 
 from kubectl_explain_failure.causality import CausalChain, Cause
 from kubectl_explain_failure.rules.base_rule import FailureRule
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_message_lower, parse_time
 
 
 class InitRetryEscalationRule(FailureRule):
@@ -140,7 +140,7 @@ class InitRetryEscalationRule(FailureRule):
         return blocked or None
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _relevant_backoff_events(
         self,
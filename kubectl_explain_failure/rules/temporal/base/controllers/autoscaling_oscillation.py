@@ -9,7 +9,7 @@ from kubectl_explain_failure.rules.base_rule import FailureRule
 from kubectl_explain_failure.rules.temporal.base.controllers.replica_oscillation import (
     ReplicaOscillationRule,
 )
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import Timeline, event_reason_lower, parse_time
 
 
 class AutoscalingOscillationRule(FailureRule):
@@ -103,7 +103,7 @@ class AutoscalingOscillationRule(FailureRule):
         return str(source or "").lower()
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _message(self, value: Any) -> str:
         return str(value or "").strip()
@@ -9,7 +9,12 @@ from kubectl_explain_failure.rules.multi_container_helpers import (
     is_recognized_sidecar_container,
     is_restartable_init_sidecar,
 )
-from kubectl_explain_failure.timeline import Timeline, parse_time
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    event_message_lower,
+    event_reason_lower,
+    parse_time,
+)
 
 
 class SidecarRestartCascadeRule(FailureRule):
@@ -113,10 +118,10 @@ class SidecarRestartCascadeRule(FailureRule):
         return [event for _, event in sorted(enumerated, key=sort_key)]
 
     def _event_reason(self, event: dict[str, Any]) -> str:
-        return str(event.get("reason", "")).lower()
+        return event_reason_lower(event)
 
     def _event_message(self, event: dict[str, Any]) -> str:
-        return str(event.get("message", "")).lower()
+        return event_message_lower(event)
 
     def _event_component(self, event: dict[str, Any]) -> str:
         source = event.get("source")
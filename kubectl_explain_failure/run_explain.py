@@ -2,42 +2,333 @@
 # run_explain.py
 import argparse
 import json
+import sys
+import types
+from collections.abc import Callable, Iterator
+from datetime import timezone
+from pathlib import Path
+from typing import Any
 
 from engine import explain_failure
+from timeline import _event_ts, parse_time
 
-parser = argparse.ArgumentParser()
-parser.add_argument("--pod", required=True)
-parser.add_argument("--events", required=True)
-parser.add_argument("--enable-categories", default="")
-parser.add_argument("--disable-categories", default="")
-parser.add_argument("--verbose", action="store_true")
-parser.add_argument("--format", default="text", choices=["text", "json", "yaml"])
-args = parser.parse_args()
-
-with open(args.pod) as f:
-    pod = json.load(f)
-with open(args.events) as f:
-    events = json.load(f)
-
-result = explain_failure(
-    pod,
-    events.get("items", events),
-    enabled_categories=(
-        args.enable_categories.split() if args.enable_categories else None
-    ),
-    disabled_categories=(
-        args.disable_categories.split() if args.disable_categories else None
-    ),
-    verbose=args.verbose,
+ijson: types.ModuleType | None
+orjson: types.ModuleType | None
+
+try:
+    import ijson as _ijson
+
+    ijson = _ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path: str) -> Any:
+    # orjson decodes the raw bytes directly; large event dumps parse
+    # noticeably faster than with the stdlib decoder
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Reasons that make an event failure-relevant even when its type is Normal
+FAILURE_REASONS = frozenset(
+    {
+        "BackOff",
+        "CrashLoopBackOff",
+        "Evicted",
+        "FailedCreate",
+        "FailedMount",
+        "FailedScheduling",
+        "OOMKilled",
+        "ProbeWarning",
+        "QuotaExceeded",
+        "Unhealthy",
+    }
 )
+FAILURE_TYPES = frozenset({"Warning", "Error"})
+
+# Default cap applied by --failure-events-only when --max-events is not given
+DEFAULT_MAX_FAILURE_EVENTS = 200
+
+
+def is_failure_event(event: dict[str, Any]) -> bool:
+    return event.get("type") in FAILURE_TYPES or event.get("reason") in FAILURE_REASONS
+
+
+def event_recency(event: dict[str, Any]) -> float:
+    """
+    POSIX time of an event's timestamp; missing or unparseable timestamps
+    rank as the oldest.
+    """
+    try:
+        parsed = parse_time(_event_ts(event))
+    except (TypeError, ValueError):
+        return float("-inf")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def cap_events(events: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """
+    Keeps at most `limit` events, preferring known failure reasons over
+    other warnings and newer events over older ones. Recency comes from the
+    event timestamps, since `kubectl get events` output is not time-ordered;
+    list position only breaks ties. The survivors keep their original order
+    so timeline rules still see a sequence.
+    """
+    if len(events) <= limit:
+        return events
+
+    recency = [event_recency(e) for e in events]
+    ranked = sorted(
+        range(len(events)),
+        key=lambda i: (
+            events[i].get("reason") not in FAILURE_REASONS,
+            -recency[i],
+            -i,
+        ),
+    )
+    return [events[i] for i in sorted(ranked[:limit])]
+
+
+def intern_event_fields(events: list[dict[str, Any]]) -> None:
+    """
+    Interns the small-vocabulary event fields in place. Freshly parsed JSON
+    strings are distinct objects; interned ones let rule comparisons such as
+    reason == "BackOff" resolve on identity.
+    """
+    for e in events:
+        for key in ("reason", "type"):
+            value = e.get(key)
+            if isinstance(value, str):
+                e[key] = sys.intern(value)
+        involved = e.get("involvedObject")
+        if isinstance(involved, dict) and isinstance(involved.get("kind"), str):
+            involved["kind"] = sys.intern(involved["kind"])
+
+
+def _stream_events(
+    path: str,
+    keep: Callable[[dict[str, Any]], bool],
+) -> list[dict[str, Any]] | None:
+    """
+    Streams the items of a JSON array or List document with ijson, keeping
+    only those accepted by `keep`. Returns None when no compiled ijson
+    backend is available or the file turns out to be neither.
+    """
+    # The pure-Python backend is slower than a full parse
+    if ijson is None or ijson.backend == "python":
+        return None
+    with open(path, "rb") as f:
+        parse_events = ijson.parse(f, use_float=True)
+        first = next(parse_events, None)
+        if first is None or first[1] not in ("start_array", "start_map"):
+            return None
+        is_array = first[1] == "start_array"
+        saw_items = False
+
+        def tracked() -> Iterator[tuple[str, str, Any]]:
+            nonlocal saw_items
+            yield first
+            for prefix, event, value in parse_events:
+                if prefix == "" and event == "map_key" and value == "items":
+                    saw_items = True
+                yield prefix, event, value
+
+        items = [
+            e
+            for e in ijson.items(tracked(), "item" if is_array else "items.item")
+            if keep(e)
+        ]
+    return items if is_array or saw_items else None
+
+
+def load_events(
+    path: str,
+    keep: Callable[[dict[str, Any]], bool] | None = None,
+) -> Any:
+    """
+    Returns the events of a Kubernetes List dump (its "items") or of a bare
+    JSON array, optionally only those accepted by `keep`.
+
+    When filtering with a compiled ijson backend installed, the items are
+    streamed one object at a time, so rejected events are dropped as they
+    are read instead of being held in memory with the full document.
+    Unfiltered loads keep everything anyway and use the faster full parse.
+    """
+    if keep is not None:
+        items = _stream_events(path, keep)
+        if items is not None:
+            return items
+
+    events = load_json(path)
+    if isinstance(events, dict):
+        events = events.get("items", events)
+    if keep is not None:
+        events = [e for e in events if keep(e)]
+    return events
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def category_set(value: str) -> frozenset[str] | None:
+    # Space-separated category names; empty means no filter
+    return frozenset(value.split()) or None
+
+
+def pod_batch(pods_dir: str) -> list[tuple[Path, Path | None]]:
+    """
+    Pairs every pod file in `pods_dir` with its events file, if any.
+
+    NAME.json is a pod; NAME-events.json or NAME_events.json holds its
+    events. Pods without an events file are explained with no events.
+    """
+    files = sorted(Path(pods_dir).glob("*.json"))
+    names = {f.name for f in files}
+    batch = []
+    for f in files:
+        if f.stem.endswith(("-events", "_events")):
+            continue
+        events_file = next(
+            (
+                f.with_name(f"{f.stem}{sep}events.json")
+                for sep in ("-", "_")
+                if f"{f.stem}{sep}events.json" in names
+            ),
+            None,
+        )
+        batch.append((f, events_file))
+    return batch
+
+
+def dumps_line(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def prepare_events(
+    path: str,
+    failure_events_only: bool = False,
+    max_events: int | None = None,
+) -> Any:
+    events = load_events(
+        path,
+        keep=is_failure_event if failure_events_only else None,
+    )
+    if isinstance(events, list):
+        intern_event_fields(events)
+    if max_events is not None:
+        events = cap_events(events, max_events)
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pod")
+    parser.add_argument("--events")
+    parser.add_argument(
+        "--pods-dir",
+        help="Explain every pod in DIR and write one JSON line per pod",
+    )
+    parser.add_argument("--enable-categories", type=category_set, default=None)
+    parser.add_argument("--disable-categories", type=category_set, default=None)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "yaml"],
+        help="Single-pod output format (default: text)",
+    )
+    # Opt-in: some rules also look at Normal events (Scheduled, Pulled, ...)
+    parser.add_argument("--failure-events-only", action="store_true")
+    parser.add_argument("--max-events", type=positive_int, default=None)
+    args = parser.parse_args()
+
+    if args.pods_dir is None and not (args.pod and args.events):
+        parser.error("either --pod and --events, or --pods-dir, is required")
+    if args.pods_dir is not None and args.format is not None:
+        parser.error("--format cannot be used with --pods-dir, which writes JSON Lines")
+
+    max_events = args.max_events
+    if max_events is None and args.failure_events_only:
+        max_events = DEFAULT_MAX_FAILURE_EVENTS
+
+    def explain(pod: dict[str, Any], events: Any) -> dict[str, Any]:
+        return explain_failure(
+            pod,
+            events,
+            enabled_categories=args.enable_categories,
+            disabled_categories=args.disable_categories,
+            verbose=args.verbose,
+        )
+
+    if args.pods_dir is not None:
+        # Batch mode: rules are loaded and indexed once, by the first pod, and
+        # reused for the rest; output is always JSON Lines
+        failed = False
+        for pod_file, events_file in pod_batch(args.pods_dir):
+            # One unreadable or unexplainable pod must not end the batch
+            try:
+                batch_events = (
+                    prepare_events(
+                        str(events_file), args.failure_events_only, max_events
+                    )
+                    if events_file
+                    else []
+                )
+                record = explain(load_json(str(pod_file)), batch_events)
+            except Exception as exc:
+                failed = True
+                record = {"error": f"{type(exc).__name__}: {exc}"}
+            print(dumps_line({"file": pod_file.name, **record}), flush=True)
+        if failed:
+            sys.exit(1)
+        return
+
+    pod = load_json(args.pod)
+    events = prepare_events(args.events, args.failure_events_only, max_events)
+    result = explain(pod, events)
+
+    if args.format == "json":
+        if orjson is not None:
+            print(
+                orjson.dumps(
+                    result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            )
+        else:
+            print(json.dumps(result, indent=2))
+    elif args.format == "yaml":
+        import yaml
+
+        try:
+            from yaml import CSafeDumper as _YamlDumper
+        except ImportError:
+            from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+        # yaml.dump with a safe dumper: libyaml's emitter when it is available
+        print(yaml.dump(result, Dumper=_YamlDumper, sort_keys=False))
+    else:
+        print("Root cause:", result.get("root_cause"))
+        print("Confidence:", result.get("confidence"))
+        print("Evidence:", result.get("evidence"))
 
-if args.format == "json":
-    print(json.dumps(result, indent=2))
-elif args.format == "yaml":
-    import yaml
 
-    print(yaml.safe_dump(result, sort_keys=False))
-else:
-    print("Root cause:", result.get("root_cause"))
-    print("Confidence:", result.get("confidence"))
-    print("Evidence:", result.get("evidence"))
+if __name__ == "__main__":
+    main()
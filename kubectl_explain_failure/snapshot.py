@@ -1,11 +1,34 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only default for missing pod sub-objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class ClusterSnapshot:
     """
     Normalized view of all Kubernetes objects relevant to diagnosis.
+
+    Inputs are retained by reference, not copied, and must not be mutated.
     """
 
+    # One snapshot per pod; slots keep batch runs compact. pod_phase and
+    # pod_name are resolved up front since slots rule out cached_property.
+    __slots__ = (
+        "pod",
+        "events",
+        "node",
+        "pvcs",
+        "pvc",
+        "services",
+        "endpoints",
+        "statefulsets",
+        "daemonsets",
+        "pod_phase",
+        "pod_name",
+    )
+
     def __init__(
         self,
         pod: dict[str, Any],
@@ -23,10 +46,5 @@ class ClusterSnapshot:
         self.statefulsets: list[dict[str, Any]] = context.get("sts", [])
         self.daemonsets: list[dict[str, Any]] = context.get("ds", [])
 
-    @property
-    def pod_phase(self) -> str:
-        return self.pod.get("status", {}).get("phase", "Unknown")
-
-    @property
-    def pod_name(self) -> str:
-        return self.pod.get("metadata", {}).get("name", "<unknown>")
+        self.pod_phase: str = pod.get("status", _EMPTY).get("phase", "Unknown")
+        self.pod_name: str = pod.get("metadata", _EMPTY).get("name", "<unknown>")
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+from kubectl_explain_failure.loader import load_rules
+
+# Put the package directory on sys.path once for the whole suite instead of
+# at the top of individual test modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+RULES_DIR = os.path.join(os.path.dirname(__file__), "..", "rules")
+
+
+@pytest.fixture(scope="session")
+def all_rules():
+    """
+    Every bundled rule, loaded once per test session.
+    Tests must not mutate the returned list or its rules.
+    """
+    return load_rules(RULES_DIR)
@@ -1,4 +1,6 @@
 from kubectl_explain_failure.engine import explain_failure
+from kubectl_explain_failure.model import normalize_events
+from kubectl_explain_failure.snapshot import ClusterSnapshot
 
 
 def test_engine_preserves_pod_level_objects_for_compound_rules():
@@ -96,3 +98,23 @@ def test_engine_preserves_pod_level_objects_even_when_no_rule_matches():
 
     # 3. No false positives — Unknown is correct when no rule matches
     assert result["root_cause"] == "Unknown"
+
+
+def test_pod_and_events_are_retained_by_reference():
+    """
+    Inputs are read-only by contract, so neither event normalization nor
+    the engine copies them on the way to the rules.
+    """
+    events = [{"reason": "BackOff", "type": "Warning"}]
+    pod = {"metadata": {"name": "p"}, "status": {"phase": "Running"}}
+
+    assert normalize_events(events) is events
+    assert normalize_events({"kind": "List", "items": events}) is events
+
+    context: dict = {"objects": {}}
+    explain_failure(pod, events, context=context)
+    assert context["timeline"].events is events
+
+    snapshot = ClusterSnapshot(pod, events, context)
+    assert snapshot.pod is pod
+    assert snapshot.events is events
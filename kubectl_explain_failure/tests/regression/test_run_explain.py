@@ -0,0 +1,227 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+from kubectl_explain_failure import run_explain
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+
+def _event(reason, type_="Warning"):
+    return {"reason": reason, "type": type_}
+
+
+def test_is_failure_event_accepts_warning_types_and_failure_reasons():
+    assert run_explain.is_failure_event(_event("SomethingOdd", "Warning"))
+    assert run_explain.is_failure_event(_event("BackOff", "Normal"))
+    assert not run_explain.is_failure_event(_event("Pulled", "Normal"))
+
+
+def test_cap_events_returns_short_lists_unchanged():
+    events = [_event("Pulled", "Normal"), _event("BackOff")]
+
+    assert run_explain.cap_events(events, 5) is events
+
+
+def test_cap_events_keeps_failure_reasons_before_other_events():
+    events = [
+        _event("FailedMount"),
+        _event("Pulled", "Normal"),
+        _event("SomethingOdd"),
+        _event("BackOff"),
+    ]
+
+    capped = run_explain.cap_events(events, 2)
+
+    assert [e["reason"] for e in capped] == ["FailedMount", "BackOff"]
+
+
+def test_cap_events_prefers_newest_events_within_a_rank():
+    events = [_event(f"Odd{i}") for i in range(5)]
+
+    capped = run_explain.cap_events(events, 2)
+
+    assert [e["reason"] for e in capped] == ["Odd3", "Odd4"]
+
+
+def test_cap_events_preserves_original_order_of_survivors():
+    events = [
+        _event("BackOff"),
+        _event("Odd0"),
+        _event("Odd1"),
+        _event("Unhealthy"),
+        _event("Odd2"),
+    ]
+
+    capped = run_explain.cap_events(events, 3)
+
+    assert [e["reason"] for e in capped] == ["BackOff", "Unhealthy", "Odd2"]
+
+
+def test_cap_events_ranks_recency_by_timestamp_not_position():
+    events = [
+        {**_event("BackOff"), "lastTimestamp": "2024-01-01T10:05:00Z"},
+        {**_event("BackOff"), "lastTimestamp": "2024-01-01T10:09:00Z"},
+        {**_event("BackOff"), "lastTimestamp": "2024-01-01T10:01:00Z"},
+        {**_event("BackOff"), "eventTime": "2024-01-01T10:07:00.000000Z"},
+        _event("BackOff"),
+    ]
+
+    capped = run_explain.cap_events(events, 2)
+
+    assert capped == [events[1], events[3]]
+
+
+def _write_json(tmp_path, data):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_load_events_reads_list_items(tmp_path):
+    path = _write_json(tmp_path, {"kind": "List", "items": [_event("BackOff")]})
+
+    assert run_explain.load_events(path) == [_event("BackOff")]
+
+
+def test_load_events_reads_bare_array(tmp_path):
+    path = _write_json(tmp_path, [_event("Pulled", "Normal"), _event("BackOff")])
+
+    events = run_explain.load_events(path, keep=run_explain.is_failure_event)
+
+    assert events == [_event("BackOff")]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"kind": "List", "items": []},
+        {"kind": "List", "items": [_event("Pulled", "Normal")]},
+    ],
+)
+def test_load_events_returns_empty_list_when_nothing_is_kept(tmp_path, data):
+    path = _write_json(tmp_path, data)
+
+    assert run_explain.load_events(path, keep=run_explain.is_failure_event) == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"kind": "List", "items": [_event("Pulled", "Normal")]},
+        [_event("Pulled", "Normal")],
+    ],
+)
+def test_load_events_streams_arrays_and_lists_without_a_full_parse(
+    tmp_path, monkeypatch, data
+):
+    if pytest.importorskip("ijson").backend == "python":
+        pytest.skip("streaming needs a compiled ijson backend")
+    path = _write_json(tmp_path, data)
+
+    def full_parse(_path):
+        raise AssertionError("streamed document was parsed a second time")
+
+    monkeypatch.setattr(run_explain, "load_json", full_parse)
+
+    assert run_explain.load_events(path, keep=run_explain.is_failure_event) == []
+
+
+def test_load_events_without_filter_uses_full_parse(tmp_path, monkeypatch):
+    path = _write_json(tmp_path, {"kind": "List", "items": [_event("BackOff")]})
+    calls = []
+
+    def full_parse(path):
+        calls.append(path)
+        return {"kind": "List", "items": []}
+
+    monkeypatch.setattr(run_explain, "load_json", full_parse)
+
+    assert run_explain.load_events(path) == []
+    assert calls == [path]
+
+
+@pytest.mark.parametrize("value", ["0", "-3"])
+def test_max_events_must_be_positive(monkeypatch, value):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["run_explain.py", "--pod", "p.json", "--events", "e.json"]
+        + ["--max-events", value],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        run_explain.main()
+
+    assert exc.value.code == 2
+
+
+def test_pod_batch_pairs_pods_with_their_events_files(tmp_path):
+    for name in (
+        "a.json",
+        "a-events.json",
+        "b.json",
+        "b_events.json",
+        "c.json",
+        "orphan-events.json",
+        "notes.txt",
+    ):
+        (tmp_path / name).write_text("{}")
+
+    batch = run_explain.pod_batch(str(tmp_path))
+
+    assert [(pod.name, events and events.name) for pod, events in batch] == [
+        ("a.json", "a-events.json"),
+        ("b.json", "b_events.json"),
+        ("c.json", None),
+    ]
+
+
+def test_pods_dir_writes_one_json_line_per_pod(tmp_path, monkeypatch, capsys):
+    shutil.copy(os.path.join(FIXTURES, "pending_pod.json"), tmp_path / "web.json")
+    shutil.copy(
+        os.path.join(FIXTURES, "failed_scheduling_events_taint.json"),
+        tmp_path / "web-events.json",
+    )
+    shutil.copy(os.path.join(FIXTURES, "pending_pod.json"), tmp_path / "idle.json")
+    monkeypatch.setattr(sys, "argv", ["run_explain.py", "--pods-dir", str(tmp_path)])
+
+    run_explain.main()
+
+    lines = capsys.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["file"] for r in records] == ["idle.json", "web.json"]
+    assert all("root_cause" in r for r in records)
+
+
+def test_pods_dir_reports_bad_files_and_continues(tmp_path, monkeypatch, capsys):
+    (tmp_path / "broken.json").write_text("{not json")
+    shutil.copy(os.path.join(FIXTURES, "pending_pod.json"), tmp_path / "web.json")
+    (tmp_path / "web-events.json").write_text("[1, 2")
+    shutil.copy(os.path.join(FIXTURES, "pending_pod.json"), tmp_path / "zeta.json")
+    monkeypatch.setattr(sys, "argv", ["run_explain.py", "--pods-dir", str(tmp_path)])
+
+    with pytest.raises(SystemExit) as exc:
+        run_explain.main()
+
+    assert exc.value.code == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["file"] for r in records] == ["broken.json", "web.json", "zeta.json"]
+    assert "error" in records[0] and "error" in records[1]
+    assert "root_cause" in records[2]
+
+
+def test_pods_dir_rejects_format(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["run_explain.py", "--pods-dir", str(tmp_path), "--format", "yaml"],
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        run_explain.main()
+
+    assert exc.value.code == 2
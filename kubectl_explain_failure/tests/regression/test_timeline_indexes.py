@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta, timezone
+
+from kubectl_explain_failure.timeline import (
+    Timeline,
+    build_timeline,
+    event_frequency,
+    event_message_lower,
+    event_reason_lower,
+    event_reasons,
+    events_within,
+    repeated_reason,
+    timeline_has_event,
+    timeline_has_pattern,
+)
+
+
+def test_build_timeline_reflects_events_edited_in_place():
+    events = [{"reason": "Pulled"}]
+    build_timeline(events, relative_to="last_event")
+
+    events[0]["reason"] = "BackOff"
+    timeline = build_timeline(events, relative_to="last_event")
+
+    assert timeline.count(reason="BackOff") == 1
+    assert timeline.first("BackOff") is events[0]
+
+
+def test_structured_pattern_matches_in_order():
+    events = [{"reason": "Pulled", "type": "Normal"}, {"reason": "BackOff"}]
+
+    assert timeline_has_pattern(events, [{"reason": "Pulled"}, {"reason": "BackOff"}])
+    assert not timeline_has_pattern(
+        events, [{"reason": "BackOff"}, {"reason": "Pulled"}]
+    )
+    assert not timeline_has_pattern(events, [{"reason": "Pulled", "type": "Warning"}])
+
+
+def test_structured_pattern_none_value_matches_missing_key():
+    events = [{"reason": "BackOff"}]
+
+    assert timeline_has_pattern(events, [{"reason": "BackOff", "message": None}])
+
+
+def test_windowed_queries_skip_unparseable_timestamps():
+    events = [
+        {"reason": "BackOff", "lastTimestamp": "not-a-timestamp"},
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:05:00Z"},
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:10:00Z"},
+    ]
+    timeline = build_timeline(events, relative_to="last_event")
+
+    assert timeline.events_within_window(30, reason="BackOff") == events[1:]
+    assert timeline.duration_between(lambda e: e.get("reason") == "BackOff") == 0.0
+
+
+def test_events_within_window_keeps_original_order_for_unsorted_events():
+    events = [
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:20:00Z"},
+        {"reason": "Pulled", "lastTimestamp": "2024-01-01T00:00:00Z"},
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:15:00Z"},
+        {"reason": "Pulled", "lastTimestamp": "2024-01-01T00:30:00Z"},
+    ]
+    timeline = build_timeline(events, relative_to="last_event")
+
+    assert timeline.events_within_window(20) == [events[0], events[2], events[3]]
+    assert timeline.events_within_window(20, reason="BackOff") == [
+        events[0],
+        events[2],
+    ]
+
+
+def test_reason_queries_agree_with_raw_event_scan():
+    events = [
+        {"reason": "Pulled"},
+        {"reason": "BackOff", "message": "first"},
+        {"message": "no reason"},
+        {"reason": "BackOff", "message": "second"},
+    ]
+    timeline = build_timeline(events)
+
+    assert timeline.first("BackOff") is events[1]
+    assert timeline.first("OOMKilled") is None
+    assert timeline.count(reason="BackOff") == 2
+    assert timeline.count() == 4
+    assert timeline.repeated("BackOff", 2)
+    assert not timeline.repeated("Pulled", 2)
+    assert event_frequency(timeline, "BackOff") == event_frequency(events, "BackOff")
+    assert timeline.reason_counts == {"Pulled": 1, "BackOff": 2}
+    assert repeated_reason(events, "BackOff", 2)
+    assert not repeated_reason(events, "BackOff", 3)
+
+
+def test_timeline_has_event_agrees_for_raw_list_and_timeline():
+    events = [
+        {"reason": "Pulled", "source": {"component": "kubelet"}},
+        {"reason": "FailedMount", "source": "kubelet"},
+    ]
+
+    raw_result = timeline_has_event(events, kind="Volume", phase="Failure")
+    timeline = build_timeline(events)
+
+    assert raw_result is True
+    assert timeline_has_event(timeline, kind="Volume", phase="Failure") is True
+    assert timeline_has_event(events, kind="Volume", phase="Failure") is True
+    assert timeline_has_event(events, kind="Image", phase="Failure") is False
+    assert timeline_has_event(events, source="kubelet", kind="Image") is True
+
+
+def test_events_within_filters_utc_and_offset_timestamps():
+    now = datetime.now(timezone.utc)
+    recent = now - timedelta(minutes=1)
+    old = now - timedelta(minutes=30)
+    events = [
+        {"reason": "Old", "lastTimestamp": old.strftime("%Y-%m-%dT%H:%M:%SZ")},
+        {"reason": "Recent", "lastTimestamp": recent.strftime("%Y-%m-%dT%H:%M:%SZ")},
+        {"reason": "RecentOffset", "lastTimestamp": recent.isoformat()},
+        {"reason": "NoTimestamp"},
+    ]
+
+    assert [e["reason"] for e in events_within(events, 10)] == [
+        "Recent",
+        "RecentOffset",
+    ]
+
+
+def test_timeline_builds_derived_views_on_first_use():
+    events = [
+        {"reason": "FailedMount", "lastTimestamp": "2024-01-01T00:00:00Z"},
+        {"reason": "Pulled"},
+    ]
+    timeline = Timeline(events)
+
+    assert "_reasons" not in vars(timeline)
+    assert timeline.count(reason="Pulled") == 1
+    assert "normalized" not in vars(timeline)
+    assert "_parsed_ts" not in vars(timeline)
+
+    assert timeline.normalized[0].kind == "Volume"
+    assert timeline.has(kind="Volume", phase="Failure")
+
+
+def test_duration_between_only_probes_outermost_matches():
+    events = [
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:00:00Z"},
+        {"reason": "BackOff", "lastTimestamp": "2024-01-01T00:01:00Z"},
+        {"reason": "Pulled", "lastTimestamp": "2024-01-01T00:02:00Z"},
+        {"reason": "BackOff", "timestamp": "2024-01-01T00:05:00Z"},
+        {"reason": "Pulled"},
+    ]
+    probed = []
+
+    def is_backoff(e):
+        probed.append(e)
+        return e.get("reason") == "BackOff"
+
+    timeline = Timeline(events)
+
+    assert timeline.duration_between(is_backoff) == 300.0
+    assert len(probed) == 3
+    assert timeline.duration_between(lambda e: e.get("reason") == "Missing") == 0.0
+
+
+def test_event_reason_set_reuses_engine_state_for_same_events():
+    events = [
+        {"reason": "BackOff", "type": "Warning"},
+        {"reason": "Pulled", "type": "Normal"},
+        {"reason": None},
+    ]
+
+    assert event_reasons(events) == {"BackOff", "Pulled"}
+
+    precomputed = frozenset({"Precomputed"})
+    context = {"_engine_state": {"events": events, "event_reasons": precomputed}}
+    assert event_reasons(events, context) is precomputed
+    # A different event list must not see the stored set
+    assert event_reasons(list(events), context) == {"BackOff", "Pulled"}
+
+
+def test_event_lowercase_helpers_match_str_lower():
+    event = {"reason": "BackOff", "message": "Back-off Restarting FAILED container"}
+
+    assert event_reason_lower(event) == "backoff"
+    assert event_message_lower(event) == "back-off restarting failed container"
+    assert event_reason_lower({}) == ""
+    assert event_message_lower({"message": None}) == "none"
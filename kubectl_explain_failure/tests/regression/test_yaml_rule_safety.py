@@ -1,3 +1,5 @@
+import pytest
+
 from kubectl_explain_failure.loader import YamlFailureRule
 
 
@@ -54,3 +56,35 @@ def test_yaml_rule_context_node_labels_missing_does_not_crash():
     }
 
     assert rule.matches(pod={}, events=[], context=context) is False
+
+
+def test_yaml_rule_condition_is_compiled_once():
+    rule = YamlFailureRule(
+        {
+            "name": "CompiledConditionRule",
+            "category": "Generic",
+            "priority": 10,
+            "requires": {"pod": True},
+            "if": "pod['status'].get('phase') == 'Pending'",
+            "then": {"root_cause": "PendingPod"},
+        }
+    )
+
+    # Changing the spec after construction must not change evaluation
+    rule.spec["if"] = "True"
+
+    assert rule.matches({"status": {"phase": "Pending"}}, [], {}) is True
+    assert rule.matches({"status": {"phase": "Running"}}, [], {}) is False
+
+
+def test_yaml_rule_invalid_condition_fails_at_load_time():
+    with pytest.raises(SyntaxError):
+        YamlFailureRule(
+            {
+                "name": "BrokenConditionRule",
+                "category": "Generic",
+                "priority": 10,
+                "requires": {"pod": True},
+                "if": "pod[",
+            }
+        )
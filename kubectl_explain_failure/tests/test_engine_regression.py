@@ -1,10 +1,7 @@
-import os
-import sys
+from unittest.mock import Mock
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from kubectl_explain_failure.engine import explain_failure, normalize_context
 
 
@@ -96,3 +93,134 @@ def test_regression_eventless_rules(rule_class, pod, context, expected_root):
     assert isinstance(result["evidence"], list)
     assert isinstance(result["likely_causes"], list)
     assert isinstance(result["suggested_checks"], list)
+
+
+class FakeRuleTriggered:
+    name = "triggered_rule"
+    category = "container"
+    requires = {"pod": True}
+    trigger_reasons = ["BackOff"]
+
+    def __init__(self):
+        self.probes = 0
+
+    def matches(self, pod, events, context):
+        self.probes += 1
+        return True
+
+    def explain(self, pod, events, context):
+        return {"root_cause": "Triggered", "confidence": 0.5}
+
+
+def test_trigger_reasons_skip_rules_without_their_event():
+    pod = {"metadata": {"name": "p"}, "status": {"phase": "Running"}}
+    rule = FakeRuleTriggered()
+
+    result = explain_failure(pod, [{"reason": "Pulled"}], rules=[rule])
+    assert result["root_cause"] == "Unknown"
+    assert rule.probes == 0
+
+    result = explain_failure(pod, [{"reason": "BackOff"}], rules=[rule])
+    assert result["root_cause"] == "Triggered"
+    assert rule.probes == 1
+
+
+class FakeRuleLowPriority:
+    name = "low_priority_rule"
+    category = "container"
+    requires = {"pod": True}
+    priority = 10
+
+    def __init__(self):
+        self.probes = 0
+
+    def matches(self, pod, events, context):
+        self.probes += 1
+        return False
+
+    def explain(self, pod, events, context):
+        return {"root_cause": "Unreachable", "confidence": 0.1}
+
+
+@pytest.mark.parametrize(
+    "threshold, expected_probes",
+    [(None, 1), (0.95, 1), (0.9, 0)],
+)
+def test_short_circuit_skips_lower_priority_rules(threshold, expected_probes):
+    pod = {
+        "metadata": {"name": "oom-pod"},
+        "status": {
+            "phase": "Running",
+            "containerStatuses": [
+                {"lastState": {"terminated": {"reason": "OOMKilled"}}}
+            ],
+        },
+    }
+    low = FakeRuleLowPriority()
+
+    result = explain_failure(
+        pod,
+        events=[],
+        rules=[low, FakeRuleOOM()],
+        short_circuit_threshold=threshold,
+    )
+
+    assert "out-of-memory" in result["root_cause"].lower()
+    assert low.probes == expected_probes
+
+
+def test_default_rules_are_loaded_once_and_shared_across_calls(monkeypatch):
+    from kubectl_explain_failure import engine
+
+    rules = engine.get_default_rules()
+
+    def reload_rules(*args, **kwargs):
+        raise AssertionError("default rules were reloaded")
+
+    monkeypatch.setattr(engine, "load_rules", reload_rules)
+    explain_failure({"metadata": {"name": "p"}, "status": {"phase": "Pending"}}, [])
+
+    assert engine.get_default_rules() is rules
+
+
+@pytest.mark.parametrize("phase, expected_calls", [("Pending", 0), ("Running", 1)])
+def test_phase_gated_rule_is_only_probed_in_its_phases(phase, expected_calls):
+    rule = FakeRuleOOM()  # phases = ["Running"]
+    rule.matches = Mock(wraps=rule.matches)
+    pod = {"metadata": {"name": "p"}, "status": {"phase": phase}}
+
+    explain_failure(pod, events=[], rules=[rule])
+
+    assert rule.matches.call_count == expected_calls
+
+
+class FakeRulePendingOnly(FakeRuleLowPriority):
+    name = "pending_only_rule"
+    phases = ["Pending"]
+
+    def matches(self, pod, events, context):
+        return True
+
+    def explain(self, pod, events, context):
+        return {"root_cause": "PendingOnly", "confidence": 0.5}
+
+
+class FakeRuleRunningOnly(FakeRulePendingOnly):
+    name = "running_only_rule"
+    phases = ["Running"]
+
+    def explain(self, pod, events, context):
+        return {"root_cause": "RunningOnly", "confidence": 0.5}
+
+
+def test_rule_list_reordered_in_place_is_reindexed():
+    pod = {"metadata": {"name": "p"}, "status": {"phase": "Pending"}}
+    rules = [FakeRuleRunningOnly(), FakeRulePendingOnly()]
+
+    assert explain_failure(pod, [], rules=rules)["root_cause"] == "PendingOnly"
+
+    rules.reverse()
+    assert explain_failure(pod, [], rules=rules)["root_cause"] == "PendingOnly"
+
+    rules[0] = FakeRuleRunningOnly()
+    assert explain_failure(pod, [], rules=rules)["root_cause"] == "Unknown"
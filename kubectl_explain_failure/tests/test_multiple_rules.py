@@ -1,7 +1,5 @@
 import os
-import sys
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from kubectl_explain_failure.engine import explain_failure, normalize_context
 from kubectl_explain_failure.model import load_json, normalize_events
 
@@ -1,3 +1,6 @@
+import os
+import re
+
 import pytest
 
 from kubectl_explain_failure.loader import load_rules, validate_rule
@@ -37,17 +40,67 @@ def test_explain_contract_enforced():
         )
 
 
-def test_all_rules_have_metadata():
-    rules = load_rules("kubectl_explain_failure/rules")
-    for r in rules:
+def test_all_rules_have_metadata(all_rules):
+    for r in all_rules:
         assert hasattr(r, "name") and r.name
         assert hasattr(r, "category") and r.category
         assert hasattr(r, "priority")
         assert 0 <= r.priority <= 1000  # sanity check
 
 
-def test_rules_have_matches_and_explain():
-    rules = load_rules("kubectl_explain_failure/rules")
-    for r in rules:
+def test_rules_have_matches_and_explain(all_rules):
+    for r in all_rules:
         assert callable(getattr(r, "matches", None))
         assert callable(getattr(r, "explain", None))
+
+
+def test_rule_regexes_are_precompiled(all_rules):
+    for r in all_rules:
+        for attr in dir(r):
+            if attr.endswith("_RE"):
+                assert isinstance(getattr(r, attr), re.Pattern), f"{r.name}.{attr}"
+
+
+RULE_TEMPLATE = """
+from kubectl_explain_failure.rules.base_rule import FailureRule
+
+
+class TmpRule(FailureRule):
+    name = "TmpRule"
+    category = "Generic"
+    priority = {priority}
+    requires = {{"pod": True}}
+"""
+
+
+def test_load_rules_reuses_unchanged_modules_and_reloads_edited_ones(tmp_path):
+    rule_file = tmp_path / "tmp_rule.py"
+    rule_file.write_text(RULE_TEMPLATE.format(priority=10))
+
+    (first,) = load_rules(str(tmp_path))
+    (second,) = load_rules(str(tmp_path))
+    assert type(second) is type(first)
+
+    rule_file.write_text(RULE_TEMPLATE.format(priority=20))
+    stat = rule_file.stat()
+    os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    (edited,) = load_rules(str(tmp_path))
+    assert type(edited) is not type(first)
+    assert edited.priority == 20
+
+
+def test_load_rules_reads_every_yaml_rule_file(tmp_path):
+    for i in range(3):
+        (tmp_path / f"rule_{i}.yaml").write_text(
+            f"name: YamlRule{i}\n"
+            "category: Generic\n"
+            "priority: 10\n"
+            "requires: {pod: true}\n"
+            "if: 'False'\n"
+        )
+    (tmp_path / "empty.yaml").write_text("")
+
+    rules = load_rules(str(tmp_path))
+
+    assert sorted(r.name for r in rules) == ["YamlRule0", "YamlRule1", "YamlRule2"]
@@ -1,10 +1,9 @@
+import copy
+import functools
 import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from kubectl_explain_failure.engine import explain_failure, normalize_context
 from kubectl_explain_failure.model import load_json, normalize_events
 
@@ -14,23 +13,33 @@ from kubectl_explain_failure.model import load_json, normalize_events
 
 FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
 
+
+@functools.cache
+def _load_fixture_cached(name):
+    return load_json(os.path.join(FIXTURES_DIR, name))
+
+
+def load_fixture(name):
+    # Each fixture is parsed once per session; tests get a private copy
+    # because the engine may annotate the objects it is given
+    return copy.deepcopy(_load_fixture_cached(name))
+
+
 # ----------------------------
 # Basic Pod Failure Rules
 # ----------------------------
 
 
 def test_failed_scheduling_taint():
-    pod = load_json(os.path.join(FIXTURES_DIR, "pending_pod.json"))
-    events = normalize_events(
-        load_json(os.path.join(FIXTURES_DIR, "failed_scheduling_events_taint.json"))
-    )
+    pod = load_fixture("pending_pod.json")
+    events = normalize_events(load_fixture("failed_scheduling_events_taint.json"))
 
     result = explain_failure(pod, events)
     assert any("taint" in cause.lower() for cause in result["likely_causes"])
 
 
 def test_crash_loop_backoff():
-    pod = load_json(os.path.join(FIXTURES_DIR, "pending_pod.json"))
+    pod = load_fixture("pending_pod.json")
     events = normalize_events([{"reason": "BackOff"}])
 
     result = explain_failure(pod, events)
@@ -55,8 +64,8 @@ def test_oom_killed():
 
 
 def test_failed_mount():
-    pod = load_json(os.path.join(FIXTURES_DIR, "pending_pod.json"))
-    pvc = load_json(os.path.join(FIXTURES_DIR, "pvc_pending.json"))
+    pod = load_fixture("pending_pod.json")
+    pvc = load_fixture("pvc_pending.json")
     events = [{"reason": "FailedMount"}]
 
     context = normalize_context({"pvc": pvc})
@@ -70,8 +79,8 @@ def test_failed_mount():
 
 
 def test_pvc_not_bound():
-    pod = load_json(os.path.join(FIXTURES_DIR, "pending_pod.json"))
-    pvc = load_json(os.path.join(FIXTURES_DIR, "pvc_pending.json"))
+    pod = load_fixture("pending_pod.json")
+    pvc = load_fixture("pvc_pending.json")
     events = []
 
     result = explain_failure(pod, events, context=normalize_context({"pvc": pvc}))
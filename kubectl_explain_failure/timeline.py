@@ -1,60 +1,188 @@
+import bisect
+import functools
 import re
+import sys
+from collections import Counter
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+_parse_datetime: Callable[[str], datetime] | None
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+
+    _parse_datetime = _ciso_parse_datetime
+except ImportError:
+    _parse_datetime = None
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_time(ts: str) -> datetime:
-    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    # Kubernetes events repeat the same timestamps across objects, so parsed
+    # values are memoized. ciso8601 (optional C extension) parses RFC 3339
+    # "Z" suffixes natively; anything it rejects goes through the stdlib.
+    if _parse_datetime is not None:
+        try:
+            return _parse_datetime(ts)
+        except ValueError:
+            pass
+    try:
+        # Python 3.11+ accepts a trailing "Z" without rewriting the string
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        if ts.endswith("Z"):
+            return datetime.fromisoformat(ts[:-1] + "+00:00")
+        raise
 
 
 def events_within(events: list[dict[str, Any]], minutes: int) -> list[dict[str, Any]]:
     cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+    cutoff_second = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
     result = []
 
     for e in events:
-        ts = e.get("eventTime") or e.get("lastTimestamp") or e.get("firstTimestamp")
+        ts = _event_ts(e)
         if not ts:
             continue
+        second = _utc_second(ts)
+        if second is not None and second < cutoff_second:
+            # Strictly before the cutoff's second; no need to parse
+            continue
         if parse_time(ts) >= cutoff:
             result.append(e)
 
     return result
 
 
+def _event_ts(e: dict[str, Any]) -> Any:
+    """
+    Raw timestamp of an event: eventTime → lastTimestamp → firstTimestamp.
+    """
+    return e.get("eventTime") or e.get("lastTimestamp") or e.get("firstTimestamp")
+
+
+def _utc_second(ts: Any) -> str | None:
+    """
+    Second-resolution prefix of an RFC 3339 UTC ("...Z") timestamp, which
+    orders lexicographically like the time itself. Returns None for anything
+    else so callers fall through to a full parse.
+    """
+    if (
+        isinstance(ts, str)
+        and ts.endswith("Z")
+        and len(ts) >= 20
+        and ts[4] == "-"
+        and ts[10] == "T"
+        and ts[19] in ".Z"
+    ):
+        return ts[:19]
+    return None
+
+
 def repeated_reason(events: list[dict[str, Any]], reason: str, threshold: int) -> bool:
-    return sum(1 for e in events if e.get("reason") == reason) >= threshold
+    if threshold <= 0:
+        return True
+    seen = 0
+    for e in events:
+        if e.get("reason") == reason:
+            seen += 1
+            # Stop as soon as the threshold is reached
+            if seen >= threshold:
+                return True
+    return False
+
+
+# Checked in order, first hit wins: a reason mentioning both "pull" and
+# "mount" is an Image event
+_KIND_KEYWORDS: tuple[tuple[str, str], ...] = (
+    ("pull", "Image"),
+    ("mount", "Volume"),
+    ("attach", "Volume"),
+)
+_FAILURE_KEYWORDS: tuple[str, ...] = ("fail", "backoff")
+
+
+def _classify_kind(reason_lower: str) -> str:
+    if reason_lower.startswith("failedscheduling"):
+        return "Scheduling"
+    for keyword, kind in _KIND_KEYWORDS:
+        if keyword in reason_lower:
+            return kind
+    return "Generic"
+
+
+def _classify_phase(reason_lower: str) -> str:
+    for keyword in _FAILURE_KEYWORDS:
+        if keyword in reason_lower:
+            return "Failure"
+    return "Info"
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_reason(reason: str) -> tuple[str, str]:
+    """
+    (kind, phase) for a raw reason. Reasons come from a small vocabulary,
+    so each distinct string is lower-cased and classified once.
+    """
+    reason_lower = reason.lower()
+    return _classify_kind(reason_lower), _classify_phase(reason_lower)
+
+
+def _event_source(raw: dict[str, Any]) -> str | None:
+    # handle string or dict
+    src = raw.get("source")
+    if isinstance(src, dict):
+        return src.get("component")
+    return src  # fallback to string or None
+
+
+def _classify(raw: dict[str, Any]) -> tuple[str, str, str | None]:
+    """
+    Returns the (kind, phase, source) triple for a raw event without
+    allocating a NormalizedEvent.
+    """
+    kind, phase = _classify_reason(raw.get("reason") or "")
+    return kind, phase, _event_source(raw)
+
+
+def _signature_matches(
+    signature: tuple[str, str, str | None],
+    kind: str | None,
+    phase: str | None,
+    source: str | None,
+) -> bool:
+    e_kind, e_phase, e_source = signature
+    if kind and e_kind != kind:
+        return False
+    if phase and e_phase != phase:
+        return False
+    if source and e_source != source:
+        return False
+    return True
 
 
 class NormalizedEvent:
+    # One wrapper per event; slots keep large timelines compact
+    __slots__ = ("raw", "kind", "phase", "reason", "source")
+
     def __init__(self, raw: dict[str, Any]):
         self.raw = raw
-        self.kind = self._kind()
-        self.phase = self._phase()
-        self.reason = raw.get("reason")
-
-        # handle string or dict
-        src = raw.get("source")
-        if isinstance(src, dict):
-            self.source = src.get("component")
-        else:
-            self.source = src  # fallback to string or None
-
-    def _kind(self) -> str:
-        reason = (self.raw.get("reason") or "").lower()
-        if reason.startswith("failedscheduling"):
-            return "Scheduling"
-        if "pull" in reason:
-            return "Image"
-        if "mount" in reason or "attach" in reason:
-            return "Volume"
-        return "Generic"
-
-    def _phase(self) -> str:
-        reason = (self.raw.get("reason") or "").lower()
-        if "fail" in reason or "backoff" in reason:
-            return "Failure"
-        return "Info"
+
+        # Read the reason once; kind and phase derive from it
+        reason = raw.get("reason")
+
+        self.reason = reason
+        self.kind, self.phase = _classify_reason(reason or "")
+        self.source = _event_source(raw)
+
+
+def _intern_reason(reason: Any) -> Any:
+    # Event reasons come from a small fixed vocabulary; interning them lets
+    # reason comparisons resolve on identity before falling back to __eq__.
+    if isinstance(reason, str):
+        return sys.intern(reason)
+    return reason
 
 
 class Timeline:
@@ -65,32 +193,109 @@ class Timeline:
         relative_to: str = "now",  # "now" | "last_event"
     ):
         self.events = events
-        self.normalized = [NormalizedEvent(e) for e in events]
         self.relative_to = relative_to
 
+    # Derived views below are built on first use, so constructing a Timeline
+    # is O(1) and rules only pay for the views they actually query.
+
+    @functools.cached_property
+    def _reasons(self) -> list[Any]:
+        return [_intern_reason(e.get("reason")) for e in self.events]
+
+    @functools.cached_property
+    def normalized(self) -> list[NormalizedEvent]:
+        return [NormalizedEvent(e) for e in self.events]
+
+    @functools.cached_property
+    def _signatures(self) -> set[tuple[str, str, str | None]]:
+        # Distinct (kind, phase, source) triples; structured matchers probe
+        # this handful of signatures instead of every normalized event
+        return {_classify(e) for e in self.events}
+
+    @functools.cached_property
+    def _by_reason(self) -> dict[str, list[int]]:
+        # reason -> event indices, so reason probes are dict lookups
+        by_reason: dict[str, list[int]] = {}
+        for i, r in enumerate(self._reasons):
+            if isinstance(r, str):
+                by_reason.setdefault(r, []).append(i)
+        return by_reason
+
+    @functools.cached_property
+    def _ts_str(self) -> list[Any]:
+        return [_event_ts(e) for e in self.events]
+
+    @functools.cached_property
+    def _parsed_ts(self) -> list[datetime | None]:
+        # Parsed once so windowed queries never re-parse timestamps
+        return [self._extract(ts) for ts in self._ts_str]
+
+    @staticmethod
+    def _extract(ts: Any) -> datetime | None:
+        """
+        Parses a raw event timestamp.
+        Missing or unparseable timestamps yield None.
+        """
+        if not ts:
+            return None
+        try:
+            return parse_time(ts)
+        except (TypeError, ValueError):
+            return None
+
     def first(self, reason: str):
-        for e in self.events:
-            if e.get("reason") == reason:
+        if isinstance(reason, str):
+            hits = self._by_reason.get(reason)
+            return self.events[hits[0]] if hits else None
+        for r, e in zip(self._reasons, self.events, strict=True):
+            if r == reason:
                 return e
         return None
 
     def has(self, *, kind: str | None = None, phase: str | None = None) -> bool:
-        for e in self.normalized:
-            if kind and e.kind != kind:
-                continue
-            if phase and e.phase != phase:
-                continue
-            return True
-        return False
+        return self._has_signature(kind, phase, None)
+
+    def _has_signature(
+        self,
+        kind: str | None,
+        phase: str | None,
+        source: str | None,
+    ) -> bool:
+        return any(
+            _signature_matches(sig, kind, phase, source) for sig in self._signatures
+        )
 
     def count(self, *, reason: str | None = None) -> int:
         if not reason:
             return len(self.events)
-        return sum(1 for e in self.events if e.get("reason") == reason)
+        if isinstance(reason, str):
+            return len(self._by_reason.get(reason, ()))
+        return sum(1 for r in self._reasons if r == reason)
+
+    @functools.cached_property
+    def reason_counts(self) -> Counter[str]:
+        """
+        Occurrences of every event reason, derived from the reason index so
+        rules needing several counts read them from one mapping.
+        """
+        return Counter({r: len(hits) for r, hits in self._by_reason.items()})
 
     def repeated(self, reason: str, threshold: int) -> bool:
         return self.count(reason=reason) >= threshold
 
+    @functools.cached_property
+    def _last_event_time(self) -> datetime | None:
+        """
+        Timestamp of the last event carrying one, resolved once per timeline.
+        """
+        # Find last event with a timestamp
+        for e, ts in zip(reversed(self.events), reversed(self._ts_str), strict=True):
+            ts = ts or e.get("timestamp")
+            if ts:
+                return parse_time(ts)
+
+        return None
+
     def _reference_time(self) -> datetime:
         """
         Returns the reference time used for window calculations.
@@ -102,25 +307,29 @@ class Timeline:
             return datetime.now(timezone.utc)
 
         if self.relative_to == "last_event":
-            if not self.events:
-                return datetime.now(timezone.utc)
-
-            # Find last event with a timestamp
-            for e in reversed(self.events):
-                ts = (
-                    e.get("eventTime")
-                    or e.get("lastTimestamp")
-                    or e.get("firstTimestamp")
-                    or e.get("timestamp")
-                )
-                if ts:
-                    return parse_time(ts)
+            last = self._last_event_time
+            if last is not None:
+                return last
 
             return datetime.now(timezone.utc)
 
         # Fallback safety
         return datetime.now(timezone.utc)
 
+    @functools.cached_property
+    def _time_index(self) -> tuple[list[datetime], list[int]] | None:
+        """
+        Parsed timestamps in ascending order alongside their event indices,
+        built on first windowed query. None when naive and aware timestamps
+        are mixed and therefore cannot be ordered.
+        """
+        stamped = [(dt, i) for i, dt in enumerate(self._parsed_ts) if dt is not None]
+        try:
+            stamped.sort()
+        except TypeError:
+            return None
+        return [dt for dt, _ in stamped], [i for _, i in stamped]
+
     def events_within_window(
         self,
         minutes: int,
@@ -134,19 +343,35 @@ class Timeline:
         reference = self._reference_time()
         cutoff = reference - timedelta(minutes=minutes)
 
-        result = []
-
-        for e in self.events:
-            ts = e.get("eventTime") or e.get("lastTimestamp") or e.get("firstTimestamp")
-            if not ts:
-                continue
-
-            dt = parse_time(ts)
+        if isinstance(reason, str):
+            # The reason index is already in event order; only its own
+            # timestamps need checking
+            return [
+                self.events[i]
+                for i in self._by_reason.get(reason, ())
+                if (dt := self._parsed_ts[i]) is not None and dt >= cutoff
+            ]
+
+        time_index = self._time_index
+        if time_index is None:
+            # Timestamps cannot be ordered; fall back to a linear scan
+            return [
+                e
+                for r, e, dt in zip(
+                    self._reasons, self.events, self._parsed_ts, strict=True
+                )
+                if dt is not None and dt >= cutoff and (reason is None or r == reason)
+            ]
 
-            if dt >= cutoff and (reason is None or e.get("reason") == reason):
-                result.append(e)
+        sorted_ts, sorted_idx = time_index
+        start = bisect.bisect_left(sorted_ts, cutoff)
 
-        return result
+        # Return hits in original event order, as the linear scan did
+        return [
+            self.events[i]
+            for i in sorted(sorted_idx[start:])
+            if reason is None or self._reasons[i] == reason
+        ]
 
     def duration_between(self, reason_filter: Callable[[dict], bool]) -> float:
         """
@@ -155,33 +380,47 @@ class Timeline:
 
         If fewer than two matching events exist, returns 0.
         """
-        matching = [e for e in self.events if reason_filter(e)]
+        events = self.events
 
-        if len(matching) < 2:
+        # Only the outermost matches matter: scan in from both ends and stop
+        # at the first hit instead of filtering the whole timeline
+        first = next((i for i, e in enumerate(events) if reason_filter(e)), None)
+        if first is None:
+            return 0.0
+        last = next(
+            (i for i in range(len(events) - 1, first, -1) if reason_filter(events[i])),
+            None,
+        )
+        if last is None:
             return 0.0
 
-        # Use eventTime → lastTimestamp → firstTimestamp (consistent with events_within)
-        def extract_ts(event: dict[str, Any]) -> str | None:
-            return (
-                event.get("eventTime")
-                or event.get("lastTimestamp")
-                or event.get("firstTimestamp")
-                or event.get("timestamp")
-            )
-
-        first_ts = extract_ts(matching[0])
-        last_ts = extract_ts(matching[-1])
+        start = self._duration_ts(first)
+        end = self._duration_ts(last)
 
-        if not first_ts or not last_ts:
+        if start is None or end is None:
             return 0.0
 
         try:
-            start = parse_time(first_ts)
-            end = parse_time(last_ts)
             return (end - start).total_seconds()
-        except Exception:
+        except TypeError:
+            # Mixed naive / aware timestamps
             return 0.0
 
+    def _duration_ts(self, index: int) -> datetime | None:
+        # Pre-parsed eventTime → lastTimestamp → firstTimestamp, then the
+        # legacy "timestamp" key that only duration_between honours
+        parsed = self._parsed_ts[index]
+        if parsed is not None:
+            return parsed
+
+        ts = self.events[index].get("timestamp")
+        if not ts:
+            return None
+        try:
+            return parse_time(ts)
+        except Exception:
+            return None
+
     @property
     def raw_events(self):
         """
@@ -198,6 +437,31 @@ def build_timeline(
     return Timeline(events, relative_to=relative_to)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(
+    frozen: tuple[tuple[tuple[str, Any], ...], ...],
+) -> tuple[tuple[tuple[str, ...], tuple[Any, ...], bool], ...]:
+    """
+    Splits each structured step into parallel key / value tuples so the
+    matcher compares tuples instead of re-walking step.items() per event.
+
+    The trailing flag marks steps that can use a dict-view subset test
+    (step.items() <= event.items()). Steps expecting None cannot, because
+    e.get(k) == None also matches events where the key is absent.
+    """
+    compiled = []
+    for step in frozen:
+        keys = tuple(k for k, _ in step)
+        values = tuple(v for _, v in step)
+        compiled.append((keys, values, all(v is not None for v in values)))
+    return tuple(compiled)
+
+
 def timeline_has_pattern(
     timeline: "Timeline | list[dict[str, Any]]",
     pattern: Any,
@@ -218,22 +482,38 @@ def timeline_has_pattern(
 
     # --- SIMPLE STRING / REGEX ---
     if isinstance(pattern, str):
-        regex = re.compile(pattern)
+        regex = _compile_regex(pattern)
         return any(regex.search(e.get("reason", "")) for e in events)
 
     # --- STRUCTURED SEQUENCE ---
     if not isinstance(pattern, list):
         return False
 
+    if not all(isinstance(step, dict) for step in pattern):
+        return False
+
+    frozen = tuple(tuple(step.items()) for step in pattern)
+    try:
+        steps = _compile_pattern(frozen)
+    except TypeError:
+        # Unhashable step values cannot be cached; compile for this call only
+        steps = _compile_pattern.__wrapped__(frozen)
+
     idx = 0
-    for step in pattern:
-        if not isinstance(step, dict):
-            return False
+    for step, (keys, values, subset_ok) in zip(pattern, steps, strict=True):
+        step_items = step.items()
         matched = False
         while idx < len(events):
             e = events[idx]
             idx += 1
-            if all(e.get(k) == v for k, v in step.items()):
+            if subset_ok and isinstance(e, dict):
+                # Subset test on dict views runs in C
+                if step_items <= e.items():
+                    matched = True
+                    break
+                continue
+            # Missing keys read as None, so itemgetter cannot be used here
+            if tuple(map(e.get, keys)) == values:
                 matched = True
                 break
         if not matched:
@@ -258,21 +538,15 @@ def timeline_has_event(
     Avoids fragile string/regex matching.
     """
 
-    if isinstance(timeline, Timeline):
-        normalized = timeline.normalized
-    else:
-        normalized = [NormalizedEvent(e) for e in timeline or []]
+    if not isinstance(timeline, Timeline):
+        # Raw lists are classified on the fly so the scan can exit on the
+        # first hit without building a NormalizedEvent per event.
+        return any(
+            _signature_matches(_classify(raw), kind, phase, source)
+            for raw in timeline or []
+        )
 
-    for e in normalized:
-        if kind and e.kind != kind:
-            continue
-        if phase and e.phase != phase:
-            continue
-        if source and e.source != source:
-            continue
-        return True
-
-    return False
+    return timeline._has_signature(kind, phase, source)
 
 
 # ----------------------------
@@ -290,8 +564,57 @@ def event_frequency(
     """
 
     if isinstance(timeline, Timeline):
+        if isinstance(reason, str):
+            return len(timeline._by_reason.get(reason, ()))
         events = timeline.events
     else:
         events = timeline or []
 
     return sum(1 for e in events if e.get("reason") == reason)
+
+
+def _field_set(events: list[dict[str, Any]], key: str) -> frozenset[str]:
+    return frozenset(
+        value for e in events or [] if isinstance(value := e.get(key), str) and value
+    )
+
+
+def _engine_cached_set(
+    events: list[dict[str, Any]],
+    context: dict[str, Any] | None,
+    key: str,
+) -> frozenset[str] | None:
+    # The engine precomputes these sets once per explain_failure() call;
+    # they are only valid for the exact event list they were built from
+    state = (context or {}).get("_engine_state") or {}
+    if state.get("events") is events:
+        return state.get(key)
+    return None
+
+
+def event_reasons(
+    events: list[dict[str, Any]],
+    context: dict[str, Any] | None = None,
+) -> frozenset[str]:
+    """
+    Distinct event reasons, for O(1) `"BackOff" in reasons` probes.
+    Reuses the set precomputed by the engine when available.
+    """
+    cached = _engine_cached_set(events, context, "event_reasons")
+    if cached is not None:
+        return cached
+    return _field_set(events, "reason")
+
+
+def event_reason_lower(event: dict[str, Any]) -> str:
+    """
+    Lower-cased event reason, for case-insensitive rule checks.
+    """
+    return str(event.get("reason", "")).lower()
+
+
+def event_message_lower(event: dict[str, Any]) -> str:
+    """
+    Lower-cased event message, for case-insensitive rule checks.
+    """
+    return str(event.get("message", "")).lower()